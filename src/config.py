@@ -13,12 +13,28 @@
 
 import os
 import sys
+import types
+import functools
 from dotenv import load_dotenv
 from utils.logger import setup_logger
 
 # 初始化日志
 logger = setup_logger()
 
+@functools.lru_cache(maxsize=1)
+def _load_env():
+    """
+    加载环境变量
+    
+    只在首次调用时解析 .env 文件，之后直接返回缓存的快照，
+    避免每次创建 Config 对象时重复读取磁盘和解析字符串
+    
+    Returns:
+        MappingProxyType: 只读的环境变量快照
+    """
+    load_dotenv()
+    return types.MappingProxyType(dict(os.environ))
+
 class Config:
     """
     配置管理类
@@ -37,34 +53,41 @@ class Config:
         从 .env 文件加载配置，设置默认值，
         并进行配置有效性检查
         """
-        # 加载.env文件
-        load_dotenv()
+        # 加载.env文件（进程内只解析一次）
+        env = _load_env()
         
         # 浏览器配置
-        self.BROWSER_TYPE = os.getenv('BROWSER_TYPE', 'chrome')
-        self.HEADLESS = os.getenv('HEADLESS', 'true').lower() == 'true'
-        self.BROWSER_USER_AGENT = os.getenv('BROWSER_USER_AGENT', 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36')
-        self.BROWSER_WIDTH = int(os.getenv('BROWSER_WIDTH', '1920'))
-        self.BROWSER_HEIGHT = int(os.getenv('BROWSER_HEIGHT', '1080'))
+        self.BROWSER_TYPE = env.get('BROWSER_TYPE', 'chrome')
+        self.HEADLESS = env.get('HEADLESS', 'true').lower() == 'true'
+        self.BROWSER_USER_AGENT = env.get('BROWSER_USER_AGENT', 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36')
+        self.BROWSER_WIDTH = int(env.get('BROWSER_WIDTH', '1920'))
+        self.BROWSER_HEIGHT = int(env.get('BROWSER_HEIGHT', '1080'))
+        self.PAGE_LOAD_TIMEOUT = float(env.get('PAGE_LOAD_TIMEOUT', '10'))
+        self.BROWSER_REMOTE_URL = env.get('BROWSER_REMOTE_URL', '')
         
         # 注册配置
-        self.REGISTER_URL = os.getenv('REGISTER_URL', 'https://app.tavily.com/sign-up')
+        self.REGISTER_URL = env.get('REGISTER_URL', 'https://app.tavily.com/sign-up')
+        self.REGISTER_COUNT = int(env.get('REGISTER_COUNT', '1'))
+        self.REGISTER_WORKERS = int(env.get('REGISTER_WORKERS', '1'))
         
         # 临时邮箱配置
-        self.TEMP_MAIL = os.getenv('TEMP_MAIL')
-        self.TEMP_MAIL_EXT = os.getenv('TEMP_MAIL_EXT', '@mailto.plus')
-        self.TEMP_MAIL_EPIN = os.getenv('TEMP_MAIL_EPIN')
-        self.TEMP_MAIL_API_URL = os.getenv('TEMP_MAIL_API_URL', 'https://tempmail.plus/api')
+        self.TEMP_MAIL = env.get('TEMP_MAIL')
+        self.TEMP_MAIL_EXT = env.get('TEMP_MAIL_EXT', '@mailto.plus')
+        self.TEMP_MAIL_EPIN = env.get('TEMP_MAIL_EPIN')
+        self.TEMP_MAIL_API_URL = env.get('TEMP_MAIL_API_URL', 'https://tempmail.plus/api')
         
         # 域名配置
-        self.DOMAIN = os.getenv('DOMAIN', '@lzban8.me')
+        self.DOMAIN = env.get('DOMAIN', '@lzban8.me')
         
         # IMAP配置
-        self.IMAP_SERVER = os.getenv('IMAP_SERVER')
-        self.IMAP_PORT = int(os.getenv('IMAP_PORT', '993'))
-        self.IMAP_USER = os.getenv('IMAP_USER')
-        self.IMAP_PASS = os.getenv('IMAP_PASS')
-        self.IMAP_DIR = os.getenv('IMAP_DIR', 'INBOX')
+        self.IMAP_SERVER = env.get('IMAP_SERVER')
+        self.IMAP_PORT = int(env.get('IMAP_PORT', '993'))
+        self.IMAP_USER = env.get('IMAP_USER')
+        self.IMAP_PASS = env.get('IMAP_PASS')
+        self.IMAP_DIR = env.get('IMAP_DIR', 'INBOX')
+        
+        # 调试配置
+        self.DEBUG = env.get('DEBUG', 'false').lower() == 'true'
 
         self.check_config()
 
@@ -78,12 +101,14 @@ class Config:
         Raises:
             ValueError: 当必需的配置项缺失或无效时
         """
-        required_configs = {
-            "BROWSER_TYPE": "浏览器类型",
-        }
+        required_configs = (
+            ("BROWSER_TYPE", "浏览器类型"),
+        )
 
-        for key, name in required_configs.items():
-            if not self.check_is_valid(getattr(self, key)):
+        # 直接读取实例字典，避免逐项 getattr
+        values = self.__dict__
+        for key, name in required_configs:
+            if not self.check_is_valid(values.get(key)):
                 raise ValueError(f"{name}未配置，请在 .env 文件中设置 {key}")
 
         # 检查邮箱配置
@@ -91,14 +116,16 @@ class Config:
             if not self.check_is_valid(self.TEMP_MAIL):
                 raise ValueError("临时邮箱未配置，请在 .env 文件中设置 TEMP_MAIL")
         else:
-            imap_configs = {
-                "IMAP_SERVER": "IMAP服务器",
-                "IMAP_PORT": "IMAP端口",
-                "IMAP_USER": "IMAP用户名",
-                "IMAP_PASS": "IMAP密码",
-            }
-            for key, name in imap_configs.items():
-                if not self.check_is_valid(getattr(self, key)):
+            imap_configs = (
+                ("IMAP_SERVER", "IMAP服务器"),
+                ("IMAP_PORT", "IMAP端口"),
+                ("IMAP_USER", "IMAP用户名"),
+                ("IMAP_PASS", "IMAP密码"),
+            )
+            for key, name in imap_configs:
+                value = values.get(key)
+                # IMAP_PORT 已解析为整数，其余为字符串
+                if not (value.strip() if isinstance(value, str) else value):
                     raise ValueError(f"{name}未配置，请在 .env 文件中设置 {key}")
 
     def check_is_valid(self, value):
@@ -111,7 +138,7 @@ class Config:
         Returns:
             bool: 配置项是否有效
         """
-        return isinstance(value, str) and len(str(value).strip()) > 0
+        return isinstance(value, str) and len(value.strip()) > 0
 
     def print_config(self):
         """
@@ -132,11 +159,30 @@ class Config:
         
         logger.info(f"浏览器类型: {self.BROWSER_TYPE}")
         logger.info(f"无头模式: {self.HEADLESS}")
+        if self.BROWSER_REMOTE_URL:
+            logger.info(f"远程浏览器: {self.BROWSER_REMOTE_URL}")
+        logger.info(f"注册数量: {self.REGISTER_COUNT}")
+        if self.REGISTER_COUNT > 1:
+            logger.info(f"并行浏览器数: {self.REGISTER_WORKERS}")
+        logger.info(f"调试模式: {self.DEBUG}")
         logger.info("=== 配置信息结束 ===")
 
+@functools.lru_cache(maxsize=1)
+def get_config():
+    """
+    获取共享的配置对象
+    
+    只读场景下复用同一个 Config 实例，避免各模块重复构造。
+    需要在配置上写入运行期数据（如随机密码）时请直接创建 Config()
+    
+    Returns:
+        Config: 缓存的配置对象
+    """
+    return Config()
+
 if __name__ == "__main__":
     try:
-        config = Config()
+        config = get_config()
         logger.info("环境变量加载成功！")
         config.print_config()
     except ValueError as e:
@@ -11,14 +11,132 @@
 使用 DrissionPage 作为底层实现，提供了更稳定和高效的浏览器自动化能力。
 """
 
-import os
 import time
+import shutil
 import logging
-from DrissionPage import ChromiumPage, ChromiumOptions
+import tempfile
+from DrissionPage import Chromium, ChromiumPage, ChromiumOptions
 from utils.logger import setup_logger
 
 logger = setup_logger()
 
+# 未提供配置对象时使用的浏览器默认参数
+_DEFAULTS = {
+    'BROWSER_USER_AGENT': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36',
+    'BROWSER_WIDTH': 1920,
+    'BROWSER_HEIGHT': 1080,
+    'BROWSER_REMOTE_URL': '',
+}
+
+# 固定的浏览器启动参数（清理浏览器数据、减少启动开销）
+_CHROMIUM_ARGS = (
+    '--incognito',  # 使用隐私模式
+    '--disable-site-isolation-trials',
+    '--disable-extensions',
+    '--disable-sync',
+    '--no-default-browser-check',
+    '--no-first-run',
+    '--no-sandbox',
+    '--start-maximized',
+)
+
+# 页面就绪检查脚本
+_READY_JS = """
+    return document.readyState === 'complete' && 
+           !document.querySelector('.loading-indicator');
+"""
+
+# 一次性清理 cookies、localStorage 和 sessionStorage
+_CLEAR_STORAGE_JS = """
+    document.cookie.split(';').forEach(cookie => {
+        const eqPos = cookie.indexOf('=');
+        const name = eqPos > -1 ? cookie.substr(0, eqPos) : cookie;
+        document.cookie = name + '=;expires=Thu, 01 Jan 1970 00:00:00 GMT;path=/';
+    });
+    localStorage.clear();
+    sessionStorage.clear();
+"""
+
+# 注册流程中反复使用的元素查找函数，统一挂在 window.__th 上，启动时注入一次，
+# 之后每个新页面加载前自动定义，调用方只需执行 window.__th.findSignUp() 等
+_PAGE_HELPERS_JS = """
+window.__th = {
+    // 优先通过 href 属性匹配，由浏览器选择器引擎直接定位
+    // 找不到时再按链接文本逐个匹配
+    findSignUp: () =>
+        document.querySelector('a[href*="sign-up" i], a[href*="signup" i]') ||
+        [...document.querySelectorAll('a')].find(a => /sign\\s*up/i.test(a.textContent)) ||
+        null,
+    // 组合选择器只需遍历一次 DOM，返回文档中第一个匹配的输入框
+    findEmailInput: () =>
+        document.querySelector(
+            '#email, input.c8429dee9.c2ca7b14a, ' +
+            'input[inputmode="email"][autocomplete="email"], ' +
+            'input[type="text"][name="email"][required]'
+        ),
+    findCaptchaImg: () =>
+        document.querySelector('img[alt="captcha"]') ||
+        document.querySelector('img[src*="image/svg+xml"]') ||
+        Array.from(document.getElementsByTagName('img')).find(img =>
+            img.src && (img.src.includes('captcha') || img.src.includes('svg'))
+        ) || null,
+    findCaptchaInput: () =>
+        document.querySelector('#captcha') ||
+        document.querySelector('input[name="captcha"]') ||
+        document.querySelector('input._input-captcha') ||
+        Array.from(document.getElementsByTagName('input')).find(input => {
+            return input.className.includes('input-captcha') ||
+                   (input.type === 'text' && input.required &&
+                    input.autocapitalize === 'none' && input.spellcheck === 'false');
+        }) || null,
+    findContinueBtn: () =>
+        document.querySelector('button[type="submit"]') ||
+        document.querySelector('button._button-login-id') ||
+        document.querySelector('button[data-action-button-primary="true"]') ||
+        document.querySelector('button.c54742484.c5494d417') ||
+        Array.from(document.getElementsByTagName('button')).find(button =>
+            button.textContent.toLowerCase().includes('continue')
+        ) || null,
+    findPasswordInput: () =>
+        document.querySelector('#password') ||
+        document.querySelector('input.c8429dee9.c14adeb19') ||
+        document.querySelector('input[type="password"][required][autofocus]') ||
+        Array.from(document.getElementsByTagName('input')).find(input => {
+            return input.type === 'password' &&
+                   input.required &&
+                   input.autocomplete === 'current-password' &&
+                   input.autocapitalize === 'none';
+        }) || null,
+    findPasswordContinueBtn: () =>
+        document.querySelector('button._button-login-password[data-action-button-primary="true"]') ||
+        document.querySelector('button.c54742484.c5494d417') ||
+        document.querySelector('button[type="submit"][value="default"]') ||
+        Array.from(document.getElementsByTagName('button')).find(button =>
+            button.textContent === 'Continue' &&
+            button.classList.contains('_button-login-password')
+        ) || null
+};
+"""
+
+# 试探性查找的超时时间（秒）：后面还有备选方案时不必按默认超时等待
+PROBE_TIMEOUT = 0.2
+
+# 页面加载指示器的定位符
+LOADING_INDICATOR = 'xpath://*[contains(concat(" ", normalize-space(@class), " "), " loading-indicator ")]'
+
+# 密码输入框的定位符，注册流程和验证码处理共用
+PASSWORD_ID = 'xpath://input[@id="password"]'
+
+# 密码输入框的备选 XPath（ID 选择器失败时传给 find_any）
+PASSWORD_ALT_XPATHS = (
+    '//input[contains(@class, "c8429dee9") and contains(@class, "c14adeb19")]',  # 使用完整的类名
+    '//input[@name="password"]',  # 使用name属性
+    '//input[@type="password"]',  # 使用type属性
+)
+
+# 任一密码输入框
+PASSWORD_ANY = 'xpath:' + ' | '.join(('//input[@id="password"]',) + PASSWORD_ALT_XPATHS)
+
 class BrowserUtils:
     """
     浏览器工具类
@@ -30,17 +148,23 @@ class BrowserUtils:
     - 存储清理
     """
 
-    def __init__(self, config=None, headless=True):
+    def __init__(self, config=None, headless=True, auto_port=False):
         """
         初始化浏览器工具类
         
         Args:
             config (Config): 配置对象，包含浏览器相关配置
             headless (bool): 是否使用无头模式运行浏览器
+            auto_port (bool): 是否自动分配调试端口，多个浏览器同时运行时需要开启
         """
         self.config = config
         self.headless = headless
+        self.auto_port = auto_port
         self.page = None
+        self._profile_dir = None  # 本次运行使用的浏览器用户数据目录
+        self._remote = False  # 是否连接的是已运行的浏览器
+        self._browser = None  # 已运行的浏览器对象（仅远程模式）
+        self._context_id = None  # 本次创建的浏览器上下文 ID（仅远程模式）
 
     def start(self):
         """
@@ -52,47 +176,67 @@ class BrowserUtils:
         - 清理浏览器数据
         - 设置窗口大小
         
+        配置了 BROWSER_REMOTE_URL 时不启动新浏览器，而是连接到已运行的
+        浏览器，在独立的浏览器上下文中打开新标签页。此时用户代理和窗口大小
+        只作用于该标签页，无头模式由已运行的浏览器决定，HEADLESS 配置不生效
+        
         Returns:
             bool: 浏览器是否成功启动
         """
         try:
-            from DrissionPage import ChromiumOptions
+            # 合并默认参数与配置项，只在此处检查一次
+            cfg = dict(_DEFAULTS)
+            if self.config:
+                cfg.update({k: getattr(self.config, k) for k in _DEFAULTS if hasattr(self.config, k)})
+            
+            if cfg['BROWSER_REMOTE_URL']:
+                # 连接常驻浏览器，新上下文中的 cookies 和存储与其他标签页隔离
+                address = cfg['BROWSER_REMOTE_URL'].split('://', 1)[-1].rstrip('/')
+                self._browser = Chromium(address)
+                self.page = self._browser.new_tab(new_context=True)
+                self._remote = True
+                # 记录上下文 ID，关闭时销毁整个上下文
+                self._context_id = self.page.run_cdp('Target.getTargetInfo')['targetInfo']['browserContextId']
+                
+                # 用户代理和窗口大小只设置到本标签页，不影响浏览器中的其他标签页
+                self.page.set.user_agent(cfg['BROWSER_USER_AGENT'])
+                self.page.run_cdp('Emulation.setDeviceMetricsOverride',
+                                  width=cfg['BROWSER_WIDTH'], height=cfg['BROWSER_HEIGHT'],
+                                  deviceScaleFactor=0, mobile=False)
+                
+                self.page.add_init_js(_PAGE_HELPERS_JS)
+                logging.info("已连接到浏览器 %s（无头模式由该浏览器决定，HEADLESS 配置不生效）", address)
+                return True
             
             # 创建浏览器选项
             co = ChromiumOptions()
             
             # 添加清理浏览器数据的参数
-            co.set_argument('--incognito')  # 使用隐私模式
-            co.set_argument('--disable-site-isolation-trials')
-            co.set_argument('--disable-extensions')
-            co.set_argument('--disable-sync')
-            co.set_argument('--no-default-browser-check')
-            co.set_argument('--no-first-run')
-            co.set_argument('--no-sandbox')
-            co.set_argument('--start-maximized')
+            for arg in _CHROMIUM_ARGS:
+                co.set_argument(arg)
             
-            # 设置用户数据目录为临时目录
-            temp_dir = os.path.join(os.getcwd(), "temp_browser_data")
-            if os.path.exists(temp_dir):
-                import shutil
-                shutil.rmtree(temp_dir)
-            os.makedirs(temp_dir)
-            co.set_argument(f'--user-data-dir={temp_dir}')
+            if self.auto_port:
+                # 自动分配空闲端口和独立的用户数据目录，互不干扰
+                co.auto_port()
+            else:
+                # 每次运行使用新建的临时目录作为用户数据目录，无需先删除旧目录
+                self._profile_dir = tempfile.mkdtemp(prefix='tavily_')
+                co.set_argument(f'--user-data-dir={self._profile_dir}')
             
-            if self.headless:
-                co.set_argument('--headless')
+            # 通过 DrissionPage 的接口设置无头模式，保证其内部状态与启动参数一致
+            co.headless(self.headless)
             
-            if self.config and hasattr(self.config, 'BROWSER_USER_AGENT'):
-                co.set_argument(f'--user-agent={self.config.BROWSER_USER_AGENT}')
+            co.set_argument(f'--user-agent={cfg["BROWSER_USER_AGENT"]}')
             
             # 设置窗口大小
-            width = self.config.BROWSER_WIDTH if self.config and hasattr(self.config, 'BROWSER_WIDTH') else 1920
-            height = self.config.BROWSER_HEIGHT if self.config and hasattr(self.config, 'BROWSER_HEIGHT') else 1080
-            co.set_argument(f'--window-size={width},{height}')
+            co.set_argument(f'--window-size={cfg["BROWSER_WIDTH"]},{cfg["BROWSER_HEIGHT"]}')
             
             # 创建浏览器实例
             self.page = ChromiumPage(co)
             
+            # 注入页面查找函数，之后打开的每个页面都可直接调用
+            self.page.add_init_js(_PAGE_HELPERS_JS)
+            
             logging.info("浏览器启动成功")
             return True
             
@@ -110,20 +254,8 @@ class BrowserUtils:
         - cookies
         """
         try:
-            # 清理 cookies
-            self.page.run_js("""
-                const cookies = document.cookie.split(';');
-                for (let i = 0; i < cookies.length; i++) {
-                    const cookie = cookies[i];
-                    const eqPos = cookie.indexOf('=');
-                    const name = eqPos > -1 ? cookie.substr(0, eqPos) : cookie;
-                    document.cookie = name + '=;expires=Thu, 01 Jan 1970 00:00:00 GMT;path=/';
-                }
-            """)
-            # 清理 localStorage
-            self.page.run_js("localStorage.clear();")
-            # 清理 sessionStorage
-            self.page.run_js("sessionStorage.clear();")
+            # 单次调用完成全部清理，减少与浏览器的往返
+            self.page.run_js(_CLEAR_STORAGE_JS)
             logging.info("浏览器存储清理完成")
         except Exception as e:
             logging.error(f"清理存储失败: {str(e)}")
@@ -134,13 +266,21 @@ class BrowserUtils:
         """
         try:
             if self.page:
-                self.page.quit()
+                if self._remote:
+                    # 常驻浏览器只销毁本次创建的上下文，其中的标签页随之关闭
+                    if self._context_id:
+                        self._browser._run_cdp('Target.disposeBrowserContext',
+                                               browserContextId=self._context_id)
+                        self._context_id = None
+                    else:
+                        self.page.close()
+                else:
+                    self.page.quit()
                 
-            # 清理临时目录
-            temp_dir = os.path.join(os.getcwd(), "temp_browser_data")
-            if os.path.exists(temp_dir):
-                import shutil
-                shutil.rmtree(temp_dir)
+            # 清理本次运行的临时目录
+            if self._profile_dir:
+                shutil.rmtree(self._profile_dir, ignore_errors=True)
+                self._profile_dir = None
                 
             logging.info("浏览器已关闭")
         except Exception as e:
@@ -153,74 +293,65 @@ class BrowserUtils:
         Args:
             url: 目标URL
             max_retries: 最大重试次数
-            wait_time: 每次等待时间（秒）
+            wait_time: 每次等待页面加载的最长时间，以及失败后重试前的等待时间（秒）
             
         Returns:
             bool: 是否成功导航
         """
-        logging.info(f"正在导航到 {url}")
+        logging.info("正在导航到 %s", url)
         
         for attempt in range(max_retries):
             try:
                 if attempt > 0:
-                    logging.info(f"第 {attempt + 1} 次尝试导航...")
+                    logging.info("第 %d 次尝试导航...", attempt + 1)
                 
                 # 导航到页面
                 self.page.get(url)
                 
-                # 等待页面加载
-                time.sleep(wait_time)
+                # 等待文档加载完成、加载指示器消失，完成即返回
+                self.page.wait.doc_loaded(timeout=wait_time)
+                self.page.wait.ele_deleted(LOADING_INDICATOR, timeout=wait_time)
                 
                 # 检查页面是否完全加载
-                is_loaded = self.page.run_js("""
-                    return document.readyState === 'complete' && 
-                           !document.querySelector('.loading-indicator');
-                """)
+                is_loaded = self.page.run_js(_READY_JS)
                 
                 if is_loaded:
-                    # 额外等待以确保页面稳定
-                    time.sleep(2)
                     return True
                     
             except Exception as e:
-                logging.warning(f"导航失败 (尝试 {attempt + 1}/{max_retries}): {str(e)}")
+                logging.warning("导航失败 (尝试 %d/%d): %s", attempt + 1, max_retries, e)
                 
             time.sleep(wait_time)
             
-        logging.error(f"多次尝试后仍无法导航到 {url}")
+        logging.error("多次尝试后仍无法导航到 %s", url)
         return False
 
-    def wait_and_click(self, selector, timeout=10, check_interval=0.5):
+    def wait_and_click(self, selector, timeout=10):
         """
         等待元素出现并点击
         
         Args:
             selector: 元素选择器
             timeout: 超时时间（秒）
-            check_interval: 检查间隔（秒）
             
         Returns:
             bool: 是否成功点击
         """
         try:
-            start_time = time.time()
-            while time.time() - start_time < timeout:
-                element = self.page.ele(selector, timeout=1)
-                if element:
-                    time.sleep(1)  # 等待元素稳定
-                    element.click()
-                    time.sleep(1)  # 等待点击后的响应
-                    return True
-                time.sleep(check_interval)
+            # 由 DrissionPage 内部等待元素出现，无需在 Python 侧轮询
+            element = self.page.ele(selector, timeout=timeout)
+            if not element:
+                logging.error("等待元素超时: %s", selector)
+                return False
                 
-            logging.error(f"等待元素超时: {selector}")
-            return False
+            element.click()
+            return True
             
         except Exception as e:
-            logging.error(f"点击元素失败: {str(e)}")
+            logging.error("点击元素失败: %s", e)
             return False
 
-    def wait_and_type(self, selector, text, timeout=10, check_interval=0.5):
+    def wait_and_type(self, selector, text, timeout=10):
         """
         等待元素出现并输入文本
         
@@ -228,63 +359,92 @@ class BrowserUtils:
             selector: 元素选择器
             text: 要输入的文本
             timeout: 超时时间（秒）
-            check_interval: 检查间隔（秒）
             
         Returns:
             bool: 是否成功输入
         """
         try:
-            start_time = time.time()
-            while time.time() - start_time < timeout:
-                element = self.page.ele(selector, timeout=1)
-                if element:
-                    time.sleep(1)  # 等待元素稳定
-                    element.clear()  # 清空现有内容
-                    time.sleep(0.5)
-                    element.input(text)
-                    time.sleep(1)  # 等待输入完成
-                    return True
-                time.sleep(check_interval)
+            # 由 DrissionPage 内部等待元素出现，无需在 Python 侧轮询
+            element = self.page.ele(selector, timeout=timeout)
+            if not element:
+                logging.error("等待元素超时: %s", selector)
+                return False
                 
-            logging.error(f"等待元素超时: {selector}")
-            return False
+            element.clear()  # 清空现有内容
+            element.input(text)
+            return True
             
         except Exception as e:
-            logging.error(f"输入文本失败: {str(e)}")
+            logging.error("输入文本失败: %s", e)
             return False
 
-    def wait_for_navigation(self, timeout=30, check_interval=0.5):
+    def wait_for_navigation(self, timeout=30):
         """
         等待页面导航完成
         
         Args:
             timeout: 超时时间（秒）
-            check_interval: 检查间隔（秒）
             
         Returns:
             bool: 是否成功等待
         """
         try:
-            start_time = time.time()
-            while time.time() - start_time < timeout:
-                is_loaded = self.page.run_js("""
-                    return document.readyState === 'complete' && 
-                           !document.querySelector('.loading-indicator');
-                """)
+            # 使用 DrissionPage 内置的文档加载等待
+            if not self.page.wait.doc_loaded(timeout=timeout):
+                logging.error("等待页面导航超时")
+                return False
                 
-                if is_loaded:
-                    time.sleep(2)  # 额外等待以确保页面稳定
-                    return True
-                    
-                time.sleep(check_interval)
+            # 等待加载指示器消失
+            if not self.page.wait.ele_deleted(LOADING_INDICATOR, timeout=timeout):
+                logging.error("等待页面导航超时")
+                return False
                 
-            logging.error("等待页面导航超时")
-            return False
+            return True
             
         except Exception as e:
-            logging.error(f"等待页面导航失败: {str(e)}")
+            logging.error("等待页面导航失败: %s", e)
             return False
 
+    def find_any(self, xpaths, timeout=5):
+        """
+        查找匹配任一 XPath 的第一个元素
+        
+        将多个备选 XPath 用 | 合并为一个查询，浏览器一次遍历即可，
+        代替在 Python 中逐个尝试
+        
+        Args:
+            xpaths: XPath 表达式序列
+            timeout: 超时时间（秒）
+            
+        Returns:
+            元素对象，未找到时返回 None
+        """
+        element = self.page.ele('xpath:' + ' | '.join(xpaths), timeout=timeout)
+        return element or None
+
+    def find_many(self, js, *args):
+        """
+        通过一次 JavaScript 调用查找多个元素
+        
+        脚本需返回元素数组，DrissionPage 会将其中的节点逐个转换为元素对象，
+        代替多次单独查找带来的多次往返
+        
+        Args:
+            js: 返回元素数组的脚本
+            *args: 传给脚本的参数
+            
+        Returns:
+            list: 元素列表，未找到的位置为 None；出错时返回空列表
+        """
+        try:
+            result = self.page.run_js(js, *args)
+            if not isinstance(result, list):
+                return []
+            return [el or None for el in result]
+        except Exception as e:
+            logging.error("查找元素失败: %s", e)
+            return []
+
     def get_cookies(self):
         """
         获取所有cookies
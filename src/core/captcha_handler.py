@@ -16,6 +16,7 @@ import base64
 import logging
 import time
 import ddddocr
+import threading
 import random
 import string
 from io import BytesIO
@@ -23,11 +24,118 @@ from PIL import Image
 from utils.logger import setup_logger
 from datetime import datetime
 import numpy as np
-from PIL import ImageEnhance, ImageFilter
-from config import Config
+from PIL import ImageEnhance
+from config import get_config
+from core.browser_utils import PROBE_TIMEOUT, PASSWORD_ID, PASSWORD_ALT_XPATHS
 
 logger = setup_logger()
 
+# 进程内共享的 OCR 引擎（加载模型开销较大，只初始化一次）
+_OCR_SINGLETON = None
+_OCR_LOCK = threading.Lock()
+
+def _get_ocr():
+    """
+    获取共享的 ddddocr 实例
+    
+    首次调用时加载 ONNX 模型，之后直接复用。
+    并行注册时多个线程可能同时首次调用，加锁保证只加载一次
+    
+    Returns:
+        DdddOcr: OCR 引擎实例
+    """
+    global _OCR_SINGLETON
+    if _OCR_SINGLETON is None:
+        with _OCR_LOCK:
+            if _OCR_SINGLETON is None:
+                _OCR_SINGLETON = ddddocr.DdddOcr(show_ad=False, beta=False)
+    return _OCR_SINGLETON
+
+def _dump_async(path, data):
+    """
+    在后台线程中将数据写入文件
+    
+    调试文件的写入不阻塞验证码识别流程
+    
+    Args:
+        path (str): 文件路径
+        data (bytes): 要写入的内容
+    """
+    def write():
+        try:
+            with open(path, 'wb') as f:
+                f.write(data)
+            logging.info(f"验证码图片已保存: {path}")
+        except Exception as e:
+            logging.error(f"保存验证码图片失败: {str(e)}")
+    
+    threading.Thread(target=write, daemon=True).start()
+
+# 等待页面进入指定状态的脚本
+# 通过 MutationObserver 监听 DOM 变化，任一目标状态出现即返回，超时后返回当前状态
+_WAIT_FOR_STATE_JS = """
+const targets = arguments[0];
+const timeout = arguments[1];
+const visible = (el) => !!(el && el.offsetParent !== null);
+const probe = () => ({
+    img: !!document.querySelector('img[alt="captcha"], img[src*="image/svg+xml"]'),
+    err: visible(document.querySelector('.error-message, [role="alert"], .text-error')),
+    pw: visible(document.querySelector('#password, input[type="password"], input[name="password"]')),
+    btn: visible(document.querySelector('button._button-login-password[data-action-button-primary="true"], button[type="submit"][value="default"]'))
+});
+return new Promise((resolve) => {
+    const check = () => {
+        const state = probe();
+        return targets.some(key => state[key]) ? state : null;
+    };
+    const ready = check();
+    if (ready) {
+        resolve(ready);
+        return;
+    }
+    const timer = setTimeout(() => {
+        observer.disconnect();
+        resolve(Object.assign(probe(), {timeout: true}));
+    }, timeout);
+    const observer = new MutationObserver(() => {
+        const state = check();
+        if (state) {
+            observer.disconnect();
+            clearTimeout(timer);
+            resolve(state);
+        }
+    });
+    observer.observe(document.body, {subtree: true, childList: true, attributes: true});
+});
+"""
+
+# 以下脚本使用 BrowserUtils 启动时注入的页面函数 window.__th.*
+
+# 一次性查找验证码图片、验证码输入框和 Continue 按钮
+# 返回数组以便 DrissionPage 将各节点转换为元素对象，未找到的位置为 null
+_FIND_CAPTCHA_ELEMENTS_JS = "return [window.__th.findCaptchaImg(), window.__th.findCaptchaInput(), window.__th.findContinueBtn()];"
+_FIND_CAPTCHA_IMG_JS = "return window.__th.findCaptchaImg();"
+_FIND_CAPTCHA_INPUT_JS = "return window.__th.findCaptchaInput();"
+_FIND_CONTINUE_BTN_JS = "return window.__th.findContinueBtn();"
+_FIND_PASSWORD_INPUT_JS = "return window.__th.findPasswordInput();"
+_FIND_PASSWORD_BTN_JS = "return window.__th.findPasswordContinueBtn();"
+# 一次性查找密码输入框和 Continue 按钮
+_FIND_PASSWORD_FORM_JS = "return [window.__th.findPasswordInput(), window.__th.findPasswordContinueBtn()];"
+
+# 提交验证码后等待页面开始加载的超时时间（秒）
+_SUBMIT_START_TIMEOUT = 2
+
+# 查找验证码图片的备选选择器，按顺序尝试
+_CAPTCHA_IMG_SELECTORS = (
+    'xpath://img[@alt="captcha"]',
+    'xpath://img[contains(@src, "svg+xml")]',
+    'xpath://form//img',
+    'xpath://div//img',
+)
+
+# 验证码输入框的 ID 定位符
+_CAPTCHA_ID = 'xpath://input[@id="captcha"]'
+
 class CaptchaHandler:
     """
     验证码处理类
@@ -49,14 +157,15 @@ class CaptchaHandler:
             config: 配置对象，可选
         """
         self.page = page
-        self.config = config if config else Config()
-        # 初始化 ddddocr，使用基本配置
-        self.ocr = ddddocr.DdddOcr(show_ad=False)
+        self.config = config if config else get_config()
+        # 复用进程内共享的 ddddocr 实例
+        self.ocr = _get_ocr()
         self.logger = logging.getLogger(__name__)
         self.logger.setLevel(logging.INFO)
-        # 设置截图保存目录
+        # 设置截图保存目录（仅调试模式下使用）
         self.screenshots_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "screenshots")
-        os.makedirs(self.screenshots_dir, exist_ok=True)
+        if self.config.DEBUG:
+            os.makedirs(self.screenshots_dir, exist_ok=True)
         self.captcha_attempts = 0  # 验证码尝试计数器
 
     def verify_captcha(self, browser):
@@ -80,11 +189,13 @@ class CaptchaHandler:
             while True:  # 无限循环，直到验证成功
                 self.captcha_attempts += 1  # 增加计数器
                 logging.info(f"开始第 {self.captcha_attempts} 轮验证码识别...")
-                time.sleep(3)  # 等待验证码加载
+                self._wait_for_state('img')  # 等待验证码加载
 
-                # 查找验证码图片
+                # 一次调用查找验证码图片、输入框和按钮
                 logging.info("开始查找验证码图片...")
-                captcha_img = self._get_captcha_image()
+                captcha_img, captcha_input, continue_button = self._find_captcha_elements(browser)
+                if not captcha_img:
+                    captcha_img = self._get_captcha_image()
                 if not captcha_img:
                     logging.error("未找到验证码图片，等待3秒后重试...")
                     time.sleep(3)
@@ -97,28 +208,28 @@ class CaptchaHandler:
                     time.sleep(3)
                     continue
 
-                # 输入验证码前等待1秒
-                time.sleep(1)
-                logging.info("等待1秒后开始输入验证码...")
-
                 # 输入验证码
-                if not self._input_captcha(captcha_text):
+                if not self._input_captcha(captcha_text, captcha_input):
                     logging.error("验证码输入失败，等待3秒后重试...")
                     time.sleep(3)
                     continue
 
-                # 输入后等待1秒
-                time.sleep(1)
-                logging.info("等待1秒后点击Continue按钮...")
+                # 等待按钮可点击后再点击
+                if continue_button:
+                    continue_button.wait.clickable(timeout=3)
 
                 # 点击 Continue 按钮
-                if not self._click_continue_button():
+                if not self._click_continue_button(continue_button):
                     logging.error("点击Continue按钮失败，等待3秒后重试...")
                     time.sleep(3)
                     continue
 
-                # 等待验证结果
-                time.sleep(3)
+                # 提交表单后浏览器会重新加载页面，验证码错误时地址不变，因此不按地址判断：
+                # 等待新的加载开始（点击后很快开始，不必按页面超时等待），
+                # 再等待文档加载完成，最后在新页面中等待错误提示或密码输入框
+                self.page.wait.load_start(timeout=_SUBMIT_START_TIMEOUT)
+                self.page.wait.doc_loaded()
+                self._wait_for_state('pw', 'err')
                 
                 # 检查是否验证成功
                 js_code = """
@@ -152,7 +263,7 @@ class CaptchaHandler:
                 
                 if verification_success:
                     logging.info(f"第 {self.captcha_attempts} 次尝试验证码验证成功！")
-                    time.sleep(2)  # 等待页面完全加载
+                    self.page.wait.doc_loaded()  # 等待页面完全加载
                     return True
                     
                 logging.warning(f"第 {self.captcha_attempts} 次验证码验证失败，将尝试新的验证码...")
@@ -164,6 +275,48 @@ class CaptchaHandler:
             time.sleep(3)
             return False
 
+    def _wait_for_state(self, *states, timeout=8):
+        """
+        等待页面进入指定状态
+        
+        在浏览器内监听 DOM 变化，目标状态一出现立即返回，
+        代替固定时长的 sleep
+        
+        Args:
+            *states: 要等待的状态，可选 img（验证码图片）、err（错误提示）、
+                     pw（密码输入框）、btn（密码页 Continue 按钮）
+            timeout: 超时时间（秒）
+            
+        Returns:
+            dict: 返回时的页面状态，超时时包含 timeout 字段
+        """
+        try:
+            state = self.page.run_js(_WAIT_FOR_STATE_JS, list(states), int(timeout * 1000))
+            if state and state.get('timeout'):
+                logging.warning(f"等待页面状态 {', '.join(states)} 超时")
+            return state or {}
+        except Exception as e:
+            logging.warning(f"等待页面状态失败: {str(e)}")
+            return {}
+
+    def _find_captcha_elements(self, browser):
+        """
+        一次性查找验证码相关元素
+        
+        在一次 JavaScript 调用中同时查找验证码图片、输入框和 Continue 按钮，
+        减少与浏览器之间的往返次数
+        
+        Args:
+            browser: 浏览器工具实例
+        
+        Returns:
+            tuple: (验证码图片, 验证码输入框, Continue 按钮)，未找到的项为 None
+        """
+        elements = browser.find_many(_FIND_CAPTCHA_ELEMENTS_JS)
+        if len(elements) == 3:
+            return tuple(elements)
+        return None, None, None
+
     def _get_captcha_image(self):
         """
         获取验证码图片元素
@@ -178,26 +331,13 @@ class CaptchaHandler:
         """
         try:
             logging.info("尝试通过 JavaScript 获取验证码图片...")
-            js_code = """
-            return document.querySelector('img[alt="captcha"]') || 
-                   document.querySelector('img[src*="image/svg+xml"]') ||
-                   Array.from(document.getElementsByTagName('img')).find(img => 
-                       img.src && (img.src.includes('captcha') || img.src.includes('svg'))
-                   );
-            """
-            captcha_img = self.page.run_js(js_code)
+            captcha_img = self.page.run_js(_FIND_CAPTCHA_IMG_JS)
             
             if not captcha_img:
                 logging.warning("通过 JavaScript 未找到验证码图片，尝试其他选择器...")
-                selectors = [
-                    'img[alt="captcha"]',
-                    'img[src*="svg+xml"]',
-                    'form img',
-                    'div img'
-                ]
-                for selector in selectors:
+                for selector in _CAPTCHA_IMG_SELECTORS:
                     logging.info(f"尝试使用选择器 {selector} 查找验证码图片...")
-                    elements = self.page.eles(selector)
+                    elements = self.page.eles(selector, timeout=PROBE_TIMEOUT)
                     for element in elements:
                         src = element.attr('src')
                         if src and ('captcha' in src.lower() or 'svg' in src.lower()):
@@ -214,9 +354,10 @@ class CaptchaHandler:
         识别验证码
         
         流程包括：
-        1. 保存验证码图片
-        2. 使用 OCR 识别
-        3. 过滤和验证结果
+        1. 截取验证码图片（调试模式下同时保存到磁盘）
+        2. 预处理图片
+        3. 使用 OCR 识别
+        4. 过滤和验证结果
         
         Args:
             captcha_img: 验证码图片元素
@@ -227,21 +368,17 @@ class CaptchaHandler:
         if not captcha_img:
             return None
             
-        # 保存验证码图片
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        png_path = f"{self.screenshots_dir}/captcha_{timestamp}.png"
-        
         try:
-            # 获取验证码图片的截图
-            captcha_img.get_screenshot(png_path)
-            logging.info(f"验证码图片已保存: {png_path}")
+            # 直接在内存中获取验证码截图，无需写入再读取文件
+            image_bytes = captcha_img.get_screenshot(as_bytes='png')
             
-            # 使用本地OCR识别验证码
-            with open(png_path, 'rb') as f:
-                image_bytes = f.read()
+            # 调试模式下在后台保存验证码图片
+            if self.config.DEBUG:
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                _dump_async(f"{self.screenshots_dir}/captcha_{timestamp}.png", image_bytes)
             
             # 识别验证码
-            result = self.ocr.classification(image_bytes)
+            result = self.ocr.classification(self._preprocess_captcha(image_bytes))
             logging.info(f"原始识别结果: {result}")
             
             # 过滤结果，只保留字母和数字
@@ -262,37 +399,56 @@ class CaptchaHandler:
             logging.error(f"识别验证码失败: {str(e)}")
             return None
 
-    def _input_captcha(self, captcha_text):
+    def _preprocess_captcha(self, image_bytes):
+        """
+        验证码图片预处理
+        
+        识别前进行灰度化、增强对比度和二值化，去除背景噪点，
+        提高 OCR 的识别成功率
+        
+        Args:
+            image_bytes: 原始 PNG 图片数据
+            
+        Returns:
+            bytes: 处理后的 PNG 图片数据，处理失败时返回原始数据
+        """
+        try:
+            img = Image.open(BytesIO(image_bytes)).convert('L')
+            img = ImageEnhance.Contrast(img).enhance(1.8)
+            # 以平均灰度为阈值进行二值化（向量化运算）
+            arr = np.asarray(img)
+            arr = np.where(arr > arr.mean(), 255, 0).astype(np.uint8)
+            buf = BytesIO()
+            Image.fromarray(arr).save(buf, 'PNG')
+            return buf.getvalue()
+        except Exception as e:
+            logging.warning(f"验证码图片预处理失败，使用原图识别: {str(e)}")
+            return image_bytes
+
+    def _input_captcha(self, captcha_text, captcha_input=None):
         """
         输入验证码
         
         流程包括：
-        1. 查找验证码输入框
+        1. 查找验证码输入框（已提供时直接使用）
         2. 清空输入框
         3. 输入验证码
         
         Args:
             captcha_text: 要输入的验证码文本
+            captcha_input: 已找到的验证码输入框，可选
             
         Returns:
             bool: 是否成功输入
         """
         try:
-            logging.info("查找验证码输入框...")
-            captcha_input = self.page.ele('#captcha')
+            if not captcha_input:
+                logging.info("查找验证码输入框...")
+                captcha_input = self.page.ele(_CAPTCHA_ID, timeout=PROBE_TIMEOUT)
             
             if not captcha_input:
                 logging.info("通过ID未找到输入框，尝试其他选择器...")
-                js_code = """
-                return document.querySelector('input[name="captcha"]') ||
-                       document.querySelector('input._input-captcha') ||
-                       Array.from(document.getElementsByTagName('input')).find(input => {
-                           return input.className.includes('input-captcha') ||
-                                  (input.type === 'text' && input.required &&
-                                   input.autocapitalize === 'none' && input.spellcheck === 'false');
-                       });
-                """
-                captcha_input = self.page.run_js(js_code)
+                captcha_input = self.page.run_js(_FIND_CAPTCHA_INPUT_JS)
             
             if not captcha_input:
                 logging.error("未找到验证码输入框")
@@ -308,30 +464,29 @@ class CaptchaHandler:
             logging.error(f"验证码输入过程出错: {str(e)}")
             return False
 
-    def _click_continue_button(self):
+    def _click_continue_button(self, continue_button=None):
         """
         点击 Continue 按钮
         
-        使用多种选择器策略查找并点击按钮：
+        未提供按钮时使用多种选择器策略查找并点击按钮：
         1. 通过 type 属性
         2. 通过类名
         3. 通过文本内容
         
+        Args:
+            continue_button: 已找到的 Continue 按钮，可选
+        
         Returns:
             bool: 是否成功点击
         """
         try:
+            if continue_button:
+                continue_button.click()
+                logging.info("已点击Continue按钮")
+                return True
+            
             logging.info("查找 Continue 按钮...")
-            js_code = """
-            return document.querySelector('button[type="submit"]') || 
-                   document.querySelector('button._button-login-id') ||
-                   document.querySelector('button[data-action-button-primary="true"]') ||
-                   document.querySelector('button.c54742484.c5494d417') ||
-                   Array.from(document.getElementsByTagName('button')).find(button => 
-                       button.textContent.toLowerCase().includes('continue')
-                   );
-            """
-            continue_button = self.page.run_js(js_code)
+            continue_button = self.page.run_js(_FIND_CONTINUE_BTN_JS)
             
             if not continue_button:
                 logging.error("未找到Continue按钮")
@@ -371,106 +526,80 @@ class CaptchaHandler:
             # 查找密码输入框
             self.logger.info("开始查找密码输入框...")
             
+            # 优先一次调用同时查找密码输入框和 Continue 按钮
+            found = browser.find_many(_FIND_PASSWORD_FORM_JS)
+            if len(found) == 2 and all(found):
+                password_input, continue_button = found
+                self.logger.info("找到密码输入框和密码页面的Continue按钮")
+                if not self._handle_input(password_input, password, "密码"):
+                    return False
+                self._click_and_wait(continue_button)
+                self.logger.info("点击密码页面的Continue按钮")
+                return True
+            
             # 主选择器 - 使用ID
-            password_input = browser.page.ele('#password')
+            password_input = browser.page.ele(PASSWORD_ID, timeout=PROBE_TIMEOUT)
             if password_input:
                 self.logger.info("使用 ID 选择器 #password 找到密码输入框")
-                time.sleep(1)
                 if not self._handle_input(password_input, password, "密码"):
                     return False
                     
                 # 查找并点击 Continue 按钮
                 self.logger.info("正在查找密码页面的 Continue 按钮...")
-                time.sleep(2)  # 等待按钮加载
+                self._wait_for_state('btn')  # 等待按钮加载
                 
                 # 使用精确的选择器组合
-                js_code = """
-                return document.querySelector('button._button-login-password[data-action-button-primary="true"]') ||
-                       document.querySelector('button.c54742484.c5494d417') ||
-                       document.querySelector('button[type="submit"][value="default"]') ||
-                       Array.from(document.getElementsByTagName('button')).find(button => 
-                           button.textContent === 'Continue' &&
-                           button.classList.contains('_button-login-password')
-                       );
-                """
-                continue_button = browser.page.run_js(js_code)
+                continue_button = browser.page.run_js(_FIND_PASSWORD_BTN_JS)
                 
                 if continue_button:
                     self.logger.info("找到密码页面的Continue按钮")
-                    time.sleep(1)
-                    continue_button.click()
+                    self._click_and_wait(continue_button)
                     self.logger.info("点击密码页面的Continue按钮")
-                    time.sleep(2)
                     return True
                 else:
                     self.logger.error("未找到密码页面的Continue按钮")
                     return False
             
-            # 备选选择器 - 使用精确的类名和属性组合
-            alternative_selectors = [
-                'input.c8429dee9.c14adeb19',  # 使用完整的类名
-                'input[name="password"][type="password"]',  # 使用name和type属性组合
-                'input[type="password"][autocomplete="current-password"]',  # 使用type和autocomplete属性组合
-                'input[type="password"][required][autofocus]'  # 使用type、required和autofocus属性组合
-            ]
-            
-            for selector in alternative_selectors:
-                self.logger.info(f"尝试使用备选选择器: {selector}")
-                input_el = browser.page.ele(selector, timeout=3)
-                if input_el:
-                    self.logger.info(f"使用选择器 {selector} 找到密码输入框")
-                    time.sleep(1)
-                    if not self._handle_input(input_el, password, "密码"):
-                        return False
+            # 备选选择器 - 合并为一个 XPath 查询，浏览器一次遍历即可匹配全部候选
+            self.logger.info("尝试使用备选选择器...")
+            input_el = browser.find_any(PASSWORD_ALT_XPATHS, timeout=3)
+            if input_el:
+                self.logger.info("使用备选选择器找到密码输入框")
+                if not self._handle_input(input_el, password, "密码"):
+                    return False
                         
-                    # 查找并点击 Continue 按钮
-                    self.logger.info("正在查找密码页面的 Continue 按钮...")
-                    time.sleep(2)  # 等待按钮加载
+                # 查找并点击 Continue 按钮
+                self.logger.info("正在查找密码页面的 Continue 按钮...")
+                self._wait_for_state('btn')  # 等待按钮加载
                     
-                    continue_button = browser.page.run_js(js_code)
-                    if continue_button:
-                        self.logger.info("通过JavaScript找到密码页面的Continue按钮")
-                        time.sleep(1)
-                        continue_button.click()
-                        self.logger.info("点击密码页面的Continue按钮")
-                        time.sleep(2)
-                        return True
-                    else:
-                        self.logger.error("未找到密码页面的Continue按钮")
-                        return False
+                continue_button = browser.page.run_js(_FIND_PASSWORD_BTN_JS)
+                if continue_button:
+                    self.logger.info("通过JavaScript找到密码页面的Continue按钮")
+                    self._click_and_wait(continue_button)
+                    self.logger.info("点击密码页面的Continue按钮")
+                    return True
+                else:
+                    self.logger.error("未找到密码页面的Continue按钮")
+                    return False
             
             # 如果还是没找到，尝试通过JavaScript查找
             self.logger.info("尝试通过JavaScript查找密码输入框...")
-            js_code_input = """
-            return document.querySelector('#password') || 
-                   document.querySelector('input.c8429dee9.c14adeb19') ||
-                   document.querySelector('input[type="password"][required][autofocus]') ||
-                   Array.from(document.getElementsByTagName('input')).find(input => {
-                       return input.type === 'password' &&
-                              input.required &&
-                              input.autocomplete === 'current-password' &&
-                              input.autocapitalize === 'none';
-                   });
-            """
             try:
-                password_input = browser.page.run_js(js_code_input)
+                password_input = browser.page.run_js(_FIND_PASSWORD_INPUT_JS)
                 if password_input:
                     self.logger.info("通过JavaScript找到密码输入框")
-                    time.sleep(1)
                     if not self._handle_input(password_input, password, "密码"):
                         return False
                         
                     # 查找并点击 Continue 按钮
                     self.logger.info("正在查找密码页面的 Continue 按钮...")
-                    time.sleep(2)  # 等待按钮加载
+                    self._wait_for_state('btn')  # 等待按钮加载
                     
-                    continue_button = browser.page.run_js(js_code)
+                    continue_button = browser.page.run_js(_FIND_PASSWORD_BTN_JS)
                     if continue_button:
                         self.logger.info("通过JavaScript找到密码页面的Continue按钮")
-                        time.sleep(1)
-                        continue_button.click()
+                        self._click_and_wait(continue_button)
                         self.logger.info("点击密码页面的Continue按钮")
-                        time.sleep(2)
                         return True
                     else:
                         self.logger.error("未找到密码页面的Continue按钮")
@@ -485,15 +614,35 @@ class CaptchaHandler:
             self.logger.error(f"密码处理失败: {str(e)}")
             return False
 
+    def _click_and_wait(self, button, timeout=10):
+        """
+        点击按钮并等待页面跳转
+        
+        以地址变化作为跳转完成的信号，代替点击后固定时长的 sleep
+        
+        Args:
+            button: 要点击的按钮元素
+            timeout (float): 最长等待时间（秒）
+            
+        Returns:
+            bool: 是否在超时前完成跳转
+        """
+        prev_url = self.page.url
+        button.click()
+        if not self.page.wait.url_change(prev_url, exclude=True, timeout=timeout):
+            self.logger.warning("点击后页面未跳转")
+            return False
+        self.page.wait.doc_loaded()
+        return True
+
     def _handle_input(self, input_element, text, field_name=""):
         """
         通用输入处理
         
         提供统一的输入处理逻辑：
-        1. 输入前等待
+        1. 等待输入框可见
         2. 执行输入
-        3. 输入后等待
-        4. 错误处理
+        3. 错误处理
         
         Args:
             input_element: 输入框元素
@@ -504,13 +653,11 @@ class CaptchaHandler:
             bool: 是否输入成功
         """
         try:
-            # 输入前等待
-            time.sleep(1)
+            # 等待输入框可见
+            input_element.wait.displayed(timeout=3)
             # 输入文本
             input_element.input(text)
             self.logger.info(f"已输入{field_name}: {text}")
-            # 输入后等待
-            time.sleep(1)
             return True
         except Exception as e:
             self.logger.error(f"{field_name}输入失败: {str(e)}")
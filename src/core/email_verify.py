@@ -14,13 +14,19 @@ import os
 import re
 import time
 import json
+import random
 import logging
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
-from config import Config
+from config import get_config
 
 from utils.logger import setup_logger
 
+# 6 位数字验证码的匹配规则（排除邮箱地址、域名中的数字）
+_CODE_RE = re.compile(r"(?<![a-zA-Z@.])\b\d{6}\b")
+
 class EmailVerificationHandler:
     """
     邮箱验证处理类
@@ -39,37 +45,61 @@ class EmailVerificationHandler:
         从配置中获取：
         - 临时邮箱 API 地址
         - 邮箱域名
+        
+        并创建带连接池的 HTTP 会话，复用 TCP/TLS 连接
         """
-        self.config = Config()
+        self.config = get_config()
         self.base_url = self.config.TEMP_MAIL_API_URL
         self.domain = self.config.DOMAIN
+        
+        # 复用连接的 HTTP 会话，服务端 5xx 错误时自动重试
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=4,
+            max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=(500, 502, 503, 504))
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
 
-    def get_verification_code(self, max_retries=5, retry_interval=10):
+    def get_verification_code(self, max_retries=5, retry_interval=10, base_interval=0.5, max_interval=8):
         """
         获取验证码
         
-        通过多次尝试从邮件中获取验证码，支持重试机制
+        通过多次尝试从邮件中获取验证码。总等待时长为
+        max_retries * retry_interval 秒，重试间隔从 base_interval 开始
+        指数增长（带少量随机抖动），最长不超过 max_interval 秒，
+        邮件较快到达时可以更早取到验证码
         
         Args:
-            max_retries (int): 最大重试次数
-            retry_interval (int): 重试间隔（秒）
+            max_retries (int): 按固定间隔计算的重试次数，用于确定总等待时长
+            retry_interval (int): 按固定间隔计算的重试间隔（秒）
+            base_interval (float): 首次重试间隔（秒）
+            max_interval (float): 最大重试间隔（秒）
             
         Returns:
             str: 验证码，如果获取失败则返回 None
         """
         try:
-            for attempt in range(max_retries):
+            deadline = time.monotonic() + max_retries * retry_interval
+            attempt = 0
+            while True:
                 logging.info(f"尝试获取验证码 (第 {attempt + 1} 次)")
                 code = self._get_latest_mail_code()
                 
                 if code:
                     return code
                 
-                if attempt < max_retries - 1:
-                    logging.info(f"等待 {retry_interval} 秒后重试...")
-                    time.sleep(retry_interval)
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                
+                delay = min(base_interval * (2 ** attempt) + random.uniform(0, 0.25), max_interval, remaining)
+                logging.info(f"等待 {delay:.1f} 秒后重试...")
+                time.sleep(delay)
+                attempt += 1
             
-            logging.error(f"在 {max_retries} 次尝试后未能获取验证码")
+            logging.error(f"在 {attempt + 1} 次尝试后未能获取验证码")
             return None
 
         except Exception as e:
@@ -94,7 +124,7 @@ class EmailVerificationHandler:
             api_url = f"{self.base_url}/mail/id"
             
             # 发送请求获取邮件列表
-            response = requests.get(api_url)
+            response = self.session.get(api_url, timeout=5)
             if response.status_code != 200:
                 logging.error(f"获取邮件列表失败: {response.status_code}")
                 return None
@@ -108,7 +138,7 @@ class EmailVerificationHandler:
             latest_mail_id = mail_list[0]
             mail_content_url = f"{self.base_url}/mail/{latest_mail_id}/content"
             
-            response = requests.get(mail_content_url)
+            response = self.session.get(mail_content_url, timeout=5)
             if response.status_code != 200:
                 logging.error(f"获取邮件内容失败: {response.status_code}")
                 return None
@@ -120,7 +150,7 @@ class EmailVerificationHandler:
 
             # 使用正则表达式提取验证码
             mail_text = mail_content.get('text', '')
-            code_match = re.search(r"(?<![a-zA-Z@.])\b\d{6}\b", mail_text)
+            code_match = _CODE_RE.search(mail_text)
             
             if code_match:
                 code = code_match.group()
@@ -135,34 +165,31 @@ class EmailVerificationHandler:
             logging.error(f"获取最新邮件验证码时出错: {str(e)}")
             return None
 
-    def _cleanup_mail(self, mail_id, max_retries=3):
+    def _cleanup_mail(self, mail_id):
         """
         清理已处理的邮件
         
-        支持多次重试的邮件删除操作
+        服务端 5xx 错误的重试由会话上挂载的 Retry 负责，这里只请求一次
         
         Args:
             mail_id (str): 要删除的邮件ID
-            max_retries (int): 最大重试次数
             
         Returns:
             bool: 是否成功删除
         """
-        for attempt in range(max_retries):
-            try:
-                delete_url = f"{self.base_url}/mail/{mail_id}"
-                response = requests.delete(delete_url)
-                
-                if response.status_code == 200:
-                    logging.info(f"成功删除邮件 {mail_id}")
-                    return True
-                    
-                logging.warning(f"删除邮件失败 (尝试 {attempt + 1}/{max_retries})")
-                time.sleep(1)
-                
-            except Exception as e:
-                logging.error(f"删除邮件时出错: {str(e)}")
+        try:
+            delete_url = f"{self.base_url}/mail/{mail_id}"
+            response = self.session.delete(delete_url, timeout=5)
+            
+            if response.status_code == 200:
+                logging.info(f"成功删除邮件 {mail_id}")
+                return True
                 
+            logging.warning(f"删除邮件失败: {response.status_code}")
+            
+        except Exception as e:
+            logging.error(f"删除邮件时出错: {str(e)}")
+            
         return False
 
 if __name__ == "__main__":
@@ -17,23 +17,197 @@ import sys
 import time
 import random
 import string
+import json
 import logging
+import weakref
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from config import Config
-from core.browser_utils import BrowserUtils
-from core.email_verify import EmailVerificationHandler
-from core.captcha_handler import CaptchaHandler
+from config import Config, get_config
 from utils.logger import setup_logger
 from utils.utils import generate_random_string, generate_email, generate_password
-import csv
-from dotenv import load_dotenv
 
-# 加载环境变量
-load_dotenv()
+# 浏览器、OCR、HTTP 等较重的依赖在首次使用时才导入，
+# 配置向导等不需要它们的路径可以更快启动；环境变量由 config 模块加载
 
 # 初始化日志
 logger = setup_logger()
 
+class _AccountWriter:
+    """
+    账号信息 CSV 写入器
+    
+    文件在首次写入时打开并保持打开，每 flush_every 行刷新一次，
+    剩余内容在 close() 中刷新。批量注册时各注册任务共用同一个实例，
+    通过锁保证行不交错、表头只写一次
+    """
+
+    headers = ["邮箱", "密码", "API密钥", "创建时间"]
+
+    def __init__(self, filename="accounts.csv", flush_every=10):
+        """
+        初始化写入器
+        
+        Args:
+            filename (str): CSV 文件路径
+            flush_every (int): 每写入多少行刷新一次文件
+        """
+        self.filename = filename
+        self.flush_every = flush_every
+        self._lock = threading.Lock()
+        self._file = None
+        self._writer = None
+        self._pending = 0  # 尚未刷新到磁盘的行数
+
+    def write(self, row):
+        """
+        写入一行账号信息
+        
+        Args:
+            row (list): 一行数据
+        """
+        import csv
+        
+        with self._lock:
+            if self._writer is None:
+                # 以追加模式打开文件，添加 BOM 头
+                self._file = open(self.filename, 'a', newline='', encoding='utf-8-sig')
+                self._writer = csv.writer(self._file)
+                
+                # 如果文件为空，写入表头
+                if os.path.getsize(self.filename) == 0:
+                    self._writer.writerow(self.headers)
+                    self._file.flush()
+            
+            # 写入数据
+            self._writer.writerow(row)
+            self._pending += 1
+            if self._pending >= self.flush_every:
+                self._file.flush()
+                self._pending = 0
+
+    def close(self):
+        """
+        刷新并关闭文件，重复调用是安全的
+        """
+        with self._lock:
+            if self._file is None:
+                return
+            try:
+                self._file.close()
+            finally:
+                self._file = None
+                self._writer = None
+                self._pending = 0
+
+# 以下脚本使用 BrowserUtils 启动时注入的页面函数 window.__th.*
+
+# 等待页面加载完成后查找并点击注册链接，一次调用完成
+# 链接由前端渲染时可能晚于 load 事件出现：监听 DOM 变化，链接一出现即点击；
+# DOM 持续 300ms 无变化时（渲染告一段落）再查找一次，仍未找到则继续监听，
+# 直到超过 arguments[0] 毫秒的总时限
+# 返回是否找到并点击了链接
+_CLICK_SIGNUP_JS = """
+const timeout = arguments[0];
+return new Promise((resolve) => {
+    let observer = null;
+    let idleTimer = null;
+    const finish = (found) => {
+        if (observer) {
+            observer.disconnect();
+        }
+        clearTimeout(idleTimer);
+        clearTimeout(deadline);
+        resolve(found);
+    };
+    const deadline = setTimeout(() => finish(false), timeout);
+    const tryClick = () => {
+        const link = window.__th.findSignUp();
+        if (link) {
+            link.click();
+        }
+        return !!link;
+    };
+    const onIdle = () => {
+        if (tryClick()) {
+            finish(true);
+        }
+    };
+    const run = () => {
+        if (tryClick()) {
+            finish(true);
+            return;
+        }
+        idleTimer = setTimeout(onIdle, 300);
+        observer = new MutationObserver(() => {
+            clearTimeout(idleTimer);
+            if (tryClick()) {
+                finish(true);
+                return;
+            }
+            idleTimer = setTimeout(onIdle, 300);
+        });
+        observer.observe(document.body, {childList: true, subtree: true});
+    };
+    if (document.readyState === 'complete') {
+        run();
+    } else {
+        window.addEventListener('load', run);
+    }
+});
+"""
+
+# 页面元素定位符，统一使用 XPath，在导入时拼接完成
+_CODE_INPUT = 'xpath://input[@name="code"]'
+_SUBMIT_BUTTON = 'xpath://button[@type="submit"]'
+
+# 以下两个脚本为模板，%s 处填入 json.dumps 转义后的值，调用时无需再传参数
+# 注册表单由 React 渲染：直接给 .value 赋值会被 React 的值跟踪忽略，
+# 因此通过 HTMLInputElement 原型上的原生 setter 写入，再触发 input/change 事件，
+# 让 React 把它当作真实输入更新状态。写入后值被表单改回时，由调用方回退到 ele.input() 逐字输入
+
+# 清空元素当前值并填入新值（this 为目标输入框），触发 input/change 事件
+# 返回值是否被表单接受
+_SET_VALUE_JS = """
+const value = %s;
+const setter = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+setter.call(this, value);
+this.dispatchEvent(new Event('input', {bubbles: true}));
+this.dispatchEvent(new Event('change', {bubbles: true}));
+return this.value === value;
+"""
+
+# 查找邮箱输入框并填入邮箱，一次调用完成
+# 未找到输入框时返回 null，值被接受时返回 true，否则返回输入框元素以便回退
+_FILL_EMAIL_JS = """
+const input = window.__th.findEmailInput();
+if (!input) {
+    return null;
+}
+const value = %s;
+const setter = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+setter.call(input, value);
+input.dispatchEvent(new Event('input', {bubbles: true}));
+input.dispatchEvent(new Event('change', {bubbles: true}));
+return input.value === value ? true : input;
+"""
+
+def _shutdown_browser(browser_future, browser):
+    """
+    关闭后台启动的浏览器
+    
+    启动已结束时直接关闭；仍在启动时等启动结束后再关闭，
+    避免遗留浏览器进程和临时用户数据目录
+    
+    Args:
+        browser_future (Future): 浏览器启动任务
+        browser (BrowserUtils): 浏览器工具实例
+    """
+    if browser_future.done():
+        browser.close()
+    else:
+        browser_future.add_done_callback(lambda _: browser.close())
+
 class TavilyAutoRegister:
     """
     Tavily 自动注册类
@@ -46,15 +220,37 @@ class TavilyAutoRegister:
     - 账号信息保存
     """
 
-    def __init__(self):
-        """初始化自动注册类的各个组件"""
+    def __init__(self, auto_port=False, headless=None, accounts=None):
+        """
+        初始化自动注册类的各个组件
+        
+        Args:
+            auto_port (bool): 浏览器是否自动分配调试端口，并行注册时需要开启
+            headless (bool): 是否使用无头模式，默认使用配置中的 HEADLESS
+            accounts (_AccountWriter): 共用的账号信息写入器，默认单独创建并在 close() 时关闭
+        """
+        from core.browser_utils import BrowserUtils
+        from core.email_verify import EmailVerificationHandler
+        
         self.config = Config()  # 加载配置
-        # 从.env文件读取无头模式配置
-        headless = os.getenv('HEADLESS', 'true').lower() == 'true'
-        self.browser = BrowserUtils(config=self.config, headless=headless)  # 初始化浏览器工具
+        if headless is None:
+            headless = self.config.HEADLESS
+        self.browser = BrowserUtils(config=self.config, headless=headless, auto_port=auto_port)  # 初始化浏览器工具
         self.email_handler = EmailVerificationHandler()  # 初始化邮箱处理器
         self.captcha_handler = None  # 验证码处理器（延迟初始化）
         
+        # 在后台线程中提前启动浏览器，调用方完成其余准备工作时浏览器已在启动
+        launcher = ThreadPoolExecutor(max_workers=1)
+        self._browser_future = launcher.submit(self.browser.start)
+        launcher.shutdown(wait=False)
+        
+        # 未调用 close() 时，实例被回收或程序退出时同样会关闭浏览器
+        self._browser_finalizer = weakref.finalize(self, _shutdown_browser, self._browser_future, self.browser)
+        
+        # 账号信息写入器（由调用方传入时由调用方负责关闭）
+        self._owns_accounts = accounts is None
+        self._accounts = accounts if accounts is not None else _AccountWriter()
+        
         # 设置URL
         self.base_url = "https://app.tavily.com"
         self.signup_url = f"{self.base_url}/sign-up"
@@ -65,7 +261,7 @@ class TavilyAutoRegister:
         启动自动注册流程
         
         流程包括：
-        1. 启动浏览器
+        1. 等待浏览器启动完成
         2. 生成随机账号信息
         3. 导航到注册页面
         4. 填写注册表单
@@ -76,17 +272,19 @@ class TavilyAutoRegister:
             bool: 注册是否成功
         """
         try:
-            # 启动浏览器
-            if not self.browser.start():
+            # 生成随机邮箱和密码，此时浏览器仍在后台启动
+            logging.info("正在生成随机邮箱和密码...")
+            email = generate_email()
+            password = generate_password()
+            
+            # 等待浏览器启动完成
+            if not self._ensure_browser():
                 return False
 
             # 初始化验证码处理器
+            from core.captcha_handler import CaptchaHandler
             self.captcha_handler = CaptchaHandler(self.browser.page)
 
-            # 生成随机邮箱和密码
-            logging.info("正在生成随机邮箱和密码...")
-            email = generate_email()
-            password = generate_password()
             logging.info(f"使用邮箱: {email}")
             logging.info(f"使用密码: {password}")
             
@@ -114,7 +312,69 @@ class TavilyAutoRegister:
             logging.error(f"注册过程出错: {str(e)}")
             return False
         finally:
-            self.browser.close()
+            self.close()
+
+    def close(self):
+        """
+        关闭账号信息文件和浏览器
+        
+        浏览器仍在后台启动时不会阻塞，而是在启动结束后关闭。
+        重复调用是安全的
+        """
+        if self._owns_accounts:
+            try:
+                self._accounts.close()
+            except Exception as e:
+                logging.error(f"关闭账号信息文件失败: {str(e)}")
+        self._browser_finalizer()
+
+    def _ensure_browser(self, timeout=30):
+        """
+        等待 __init__ 中后台启动的浏览器就绪
+        
+        Args:
+            timeout (float): 最长等待时间（秒）
+            
+        Returns:
+            bool: 浏览器是否启动成功
+        """
+        try:
+            return self._browser_future.result(timeout=timeout)
+        except Exception as e:
+            logging.error(f"等待浏览器启动失败: {str(e)}")
+            return False
+
+    @staticmethod
+    def start_batch(n, max_workers=None):
+        """
+        并行注册多个账号
+        
+        每个任务使用独立的注册实例和浏览器进程（独立端口和用户数据目录），
+        cookies 和存储互不影响，账号信息通过同一个写入器写入 accounts.csv。
+        多个浏览器同时运行时不需要界面，统一使用无头模式
+        
+        Args:
+            n (int): 要注册的账号数量
+            max_workers (int): 同时运行的浏览器数量，默认与 n 相同
+            
+        Returns:
+            int: 注册成功的账号数量
+        """
+        accounts = _AccountWriter()
+        
+        def register_one(index):
+            logging.info(f"开始注册第 {index + 1}/{n} 个账号")
+            return TavilyAutoRegister(auto_port=True, headless=True, accounts=accounts).start()
+        
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers or n) as executor:
+                results = list(executor.map(register_one, range(n)))
+        finally:
+            accounts.close()
+        
+        success = sum(1 for ok in results if ok)
+        logging.info(f"批量注册完成: 成功 {success}/{n}")
+        return success
 
     def _handle_navigation(self):
         """
@@ -122,9 +382,8 @@ class TavilyAutoRegister:
         
         流程：
         1. 导航到首页
-        2. 等待页面加载
-        3. 查找并点击注册链接
-        4. 等待注册页面加载
+        2. 等待页面加载并点击注册链接（单次 JavaScript 调用）
+        3. 等待注册页面加载
         
         Returns:
             bool: 导航是否成功
@@ -134,78 +393,20 @@ class TavilyAutoRegister:
             logging.info("正在导航到首页...")
             self.browser.page.get("https://app.tavily.com")
             
-            # 等待页面加载
-            logging.info("等待页面加载...")
-            time.sleep(10)  # 增加等待时间
-            
-            # 检查页面是否完全加载
-            js_code = """
-            return new Promise((resolve) => {
-                // 检查页面加载状态
-                if (document.readyState === 'complete') {
-                    // 等待可能的动态内容加载
-                    setTimeout(() => {
-                        resolve(true);
-                    }, 2000);
-                } else {
-                    // 如果页面还没加载完，等待 load 事件
-                    window.addEventListener('load', () => {
-                        setTimeout(() => {
-                            resolve(true);
-                        }, 2000);
-                    });
-                }
-            });
-            """
-            self.browser.page.run_js(js_code)
-            
-            # 查找注册链接
+            # 等待页面加载后查找并点击注册链接
             logging.info("正在查找注册链接...")
-            js_code = """
-            function findSignUpLink() {
-                // 查找所有链接
-                const links = Array.from(document.getElementsByTagName('a'));
-                
-                // 遍历所有链接
-                for (const link of links) {
-                    const href = link.getAttribute('href') || '';
-                    const text = link.textContent.trim().toLowerCase();
-                    
-                    // 通过 href 或文本内容匹配
-                    if (href.includes('sign-up') || 
-                        href.includes('signup') || 
-                        text === 'sign up' || 
-                        text === 'signup' || 
-                        text.includes('sign up') || 
-                        text.includes('signup')) {
-                        
-                        console.log('找到注册链接:', {
-                            href: href,
-                            text: text
-                        });
-                        return link;
-                    }
-                }
-                return null;
-            }
-            return findSignUpLink();
-            """
-            
-            # 尝试查找注册链接
-            signup_link = self.browser.page.run_js(js_code)
-            
-            if signup_link:
-                logging.info("找到注册链接，正在点击...")
-                signup_link.click()
+            prev_url = self.browser.page.url
+            if self.browser.page.run_js(_CLICK_SIGNUP_JS, self.config.PAGE_LOAD_TIMEOUT * 1000):
+                logging.info("已点击注册链接")
                 
                 # 等待页面跳转和加载
-                time.sleep(5)  # 增加等待时间
+                self.browser.page.wait.url_change(prev_url, exclude=True, timeout=self.config.PAGE_LOAD_TIMEOUT)
+                self.browser.wait_for_navigation(timeout=self.config.PAGE_LOAD_TIMEOUT)
                 
                 # 验证是否成功跳转到注册页面
                 current_url = self.browser.page.url
                 if "sign-up" in current_url.lower() or "signup" in current_url.lower():
                     logging.info("成功跳转到注册页面")
-                    time.sleep(3)  # 额外等待确保页面完全加载
                     return True
                 else:
                     logging.error("跳转后的页面不是注册页面")
@@ -240,7 +441,7 @@ class TavilyAutoRegister:
                 return False
             
             logging.info("验证码处理完成")
-            time.sleep(2)
+            self.browser.wait_for_navigation(timeout=self.config.PAGE_LOAD_TIMEOUT)
             
             # 处理密码输入
             if not self.captcha_handler.handle_password_input(self.browser):
@@ -264,63 +465,75 @@ class TavilyAutoRegister:
         Returns:
             bool: 邮箱输入是否成功
         """
-        logging.info("正在查找邮箱输入框...")
-        js_code = """
-        return document.querySelector('#email') ||
-               document.querySelector('input.c8429dee9.c2ca7b14a') ||
-               document.querySelector('input[inputmode="email"][autocomplete="email"]') ||
-               document.querySelector('input[type="text"][name="email"][required]');
-        """
-        email_input = self.browser.page.run_js(js_code)
+        logging.info("正在填写邮箱...")
         
-        if email_input:
-            logging.info("找到邮箱输入框")
-            time.sleep(1)
-            
-            email_input.clear()
-            time.sleep(0.5)
-            
-            email_input.input(email)
-            logging.info("邮箱输入完成")
-            return True
+        # 查找、清空并填入邮箱在一次调用中完成
+        result = self.browser.page.run_js(_FILL_EMAIL_JS % json.dumps(email))
+        if not result:
+            logging.error("未找到邮箱输入框")
+            return False
+        
+        if result is not True:
+            # 表单没有接受脚本写入的值，改用逐字输入
+            logging.warning("脚本填写邮箱未生效，改用逐字输入")
+            result.input(email, clear=True)
         
-        logging.error("未找到邮箱输入框")
-        return False
+        logging.info("邮箱输入完成")
+        return True
 
-    def _get_api_key(self):
+    def _get_api_key(self, timeout=15, base_interval=0.1, max_interval=2):
         """
         获取 API Key
         
-        通过网络请求获取 API Key，支持重试机制
+        复用浏览器登录后的 cookies，直接请求 /api/keys 接口，
+        无需等待仪表盘页面渲染。新账号的 Key 可能稍后才生成，
+        因此轮询直到取到有效的 Key，间隔从 base_interval 开始
+        逐次翻倍，最长不超过 max_interval
+        
+        Args:
+            timeout (float): 最长轮询时间（秒）
+            base_interval (float): 首次重试间隔（秒）
+            max_interval (float): 最大重试间隔（秒）
         
         Returns:
             str: API Key 或 None（如果获取失败）
         """
-        logging.info("等待仪表盘界面加载...")
-        time.sleep(5)
+        # 登录完成后会跳转回应用域名，此时会话 cookies 才可用
+        logging.info("等待跳转回应用页面...")
+        self.browser.page.wait.url_change(self.base_url, timeout=self.config.PAGE_LOAD_TIMEOUT)
+        
+        # 将浏览器中的 cookies 导出到 HTTP 会话
+        import requests
+        session = requests.Session()
+        session.headers['User-Agent'] = self.config.BROWSER_USER_AGENT
+        for cookie in self.browser.page.cookies(all_domains=True):
+            session.cookies.set(cookie['name'], cookie['value'],
+                                domain=cookie.get('domain', ''), path=cookie.get('path', '/'))
         
         logging.info("开始尝试获取API Key...")
-        api_key = self.browser.page.run_js("""
-            async function getApiKey() {
-                await new Promise(resolve => setTimeout(resolve, 2000));
-                
-                try {
-                    console.log('尝试从网络请求中获取API Key...');
-                    const response = await fetch('/api/keys');
-                    const data = await response.json();
-                    if (data && data.length > 0 && data[0].key && data[0].key.startsWith('tvly-')) {
-                        console.log('成功从网络请求获取API Key');
-                        return data[0].key;
-                    }
-                } catch (e) {
-                    console.error('从网络请求获取API Key失败:', e);
-                }
+        api_key = None
+        deadline = time.monotonic() + timeout
+        interval = base_interval
+        with session:
+            while True:
+                # 单次请求的超时不超过剩余时间，保证总耗时受 timeout 限制
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    response = session.get(f"{self.base_url}/api/keys", timeout=min(10, remaining))
+                    data = response.json() if response.status_code == 200 else None
+                    if data and data[0].get('key', '').startswith('tvly-'):
+                        api_key = data[0]['key']
+                        break
+                except Exception as e:
+                    logging.warning(f"请求API Key失败: {str(e)}")
                 
-                console.log('无法获取API Key');
-                return null;
-            }
-            return getApiKey();
-        """)
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                time.sleep(min(interval, remaining))
+                interval = min(interval * 2, max_interval)
         
         if not api_key:
             logging.error("未找到API Key")
@@ -339,26 +552,9 @@ class TavilyAutoRegister:
             api_key (str): API Key
         """
         try:
-            filename = "accounts.csv"
-            headers = ["邮箱", "密码", "API密钥", "创建时间"]
             data = [email, password, api_key, time.strftime("%Y-%m-%d %H:%M:%S")]
-            
-            # 检查文件是否存在
-            file_exists = os.path.exists(filename)
-            
-            # 以追加模式打开文件，添加 BOM 头
-            mode = 'a' if file_exists else 'w'
-            with open(filename, mode, newline='', encoding='utf-8-sig') as f:
-                writer = csv.writer(f)
-                
-                # 如果文件不存在，写入表头
-                if not file_exists:
-                    writer.writerow(headers)
-                
-                # 写入数据
-                writer.writerow(data)
-            
-            logging.info(f"账号信息已保存到 {filename}")
+            self._accounts.write(data)
+            logging.info(f"账号信息已保存到 {self._accounts.filename}")
 
         except Exception as e:
             logging.error(f"保存账号信息失败: {str(e)}")
@@ -367,23 +563,27 @@ class TavilyAutoRegister:
         """验证邮箱"""
         try:
             logging.info("等待验证邮件...")
-            verification_code = self.email_handler.get_verification_code()
+            
+            # 在后台轮询验证邮件，同时等待验证码输入框出现
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                code_future = executor.submit(self.email_handler.get_verification_code)
+                self.browser.page.wait.ele_displayed(_CODE_INPUT, timeout=self.config.PAGE_LOAD_TIMEOUT)
+                verification_code = code_future.result()
             if not verification_code:
                 return False
 
             logging.info(f"获取到验证码: {verification_code}")
 
             # 输入验证码
-            if not self.browser.wait_and_type('input[name="code"]', verification_code):
+            if not self.browser.wait_and_type(_CODE_INPUT, verification_code):
                 return False
 
             # 点击验证按钮
-            if not self.browser.wait_and_click('button[type="submit"]'):
+            if not self.browser.wait_and_click(_SUBMIT_BUTTON):
                 return False
 
-            # 等待跳转到仪表板
-            time.sleep(3)
-            if "dashboard" in self.browser.page.url:
+            # 等待跳转到仪表板，地址出现 dashboard 即返回
+            if self.browser.page.wait.url_change('dashboard', timeout=10):
                 logging.info("邮箱验证成功")
                 return True
             else:
@@ -397,7 +597,7 @@ class TavilyAutoRegister:
     def test_email_input(self):
         """测试邮箱输入功能"""
         try:
-            if not self.browser.start():
+            if not self._ensure_browser():
                 logging.error("浏览器启动失败")
                 return False
 
@@ -411,42 +611,20 @@ class TavilyAutoRegister:
                 return False
 
             # 等待页面加载
-            time.sleep(2)
-            
-            # 查找邮箱输入框
-            logging.info("正在查找邮箱输入框...")
-            js_code = """
-            return document.querySelector('#email') ||
-                   document.querySelector('input.c8429dee9.c2ca7b14a') ||
-                   document.querySelector('input[inputmode="email"][autocomplete="email"]') ||
-                   document.querySelector('input[type="text"][name="email"][required]');
-            """
-            email_input = self.browser.page.run_js(js_code)
+            self.browser.wait_for_navigation(timeout=self.config.PAGE_LOAD_TIMEOUT)
             
-            if email_input:
-                logging.info("找到邮箱输入框")
-                time.sleep(1)
-                
-                # 清空输入框
-                email_input.clear()
-                time.sleep(0.5)
-                
-                # 输入邮箱
-                email_input.input(test_email)
-                logging.info("邮箱输入完成")
-                time.sleep(1)
-
+            # 查找邮箱输入框并填入邮箱
+            if self._handle_email_input(test_email):
                 # 处理验证码
                 if not self.captcha_handler.verify_captcha(self.browser):
                     logging.error("验证码处理失败")
                     return False
                 
                 logging.info("验证码处理完成")
-                time.sleep(1)
 
                 return True
             
-            logging.error("未找到邮箱输入框")
+            # 未找到输入框时 _handle_email_input 已记录错误
             return False
 
         except Exception as e:
@@ -454,15 +632,17 @@ class TavilyAutoRegister:
             return False
         finally:
             time.sleep(3)  # 等待一会儿以便查看结果
-            self.browser.close()
+            self.close()
 
     def test_password_input(self):
         """测试密码输入功能"""
         try:
-            if not self.browser.start():
+            if not self._ensure_browser():
                 logging.error("浏览器启动失败")
                 return False
 
+            from core.browser_utils import PROBE_TIMEOUT, PASSWORD_ID, PASSWORD_ALT_XPATHS, PASSWORD_ANY
+            
             # 生成测试密码
             test_password = generate_password()
             logging.info(f"测试密码: {test_password}")
@@ -472,28 +652,21 @@ class TavilyAutoRegister:
                 logging.error("导航到注册页面失败")
                 return False
 
-            # 等待页面加载
-            time.sleep(2)
+            # 等待密码输入框出现
+            self.browser.page.wait.ele_displayed(PASSWORD_ANY, timeout=self.config.PAGE_LOAD_TIMEOUT)
             
             # 查找密码输入框
             logging.info("正在查找密码输入框...")
-            password_input = self.browser.page.ele('#password')
+            password_input = self.browser.page.ele(PASSWORD_ID, timeout=PROBE_TIMEOUT)
             
             if password_input:
                 logging.info("使用 ID 选择器 #password 找到密码输入框")
             else:
                 logging.warning("ID 选择器失败，尝试其他选择器...")
-                alternative_selectors = [
-                    'input[name="password"]',
-                    'input[type="password"]'
-                ]
-                
-                for selector in alternative_selectors:
-                    logging.info(f"尝试选择器: {selector}")
-                    password_input = self.browser.page.ele(selector)
-                    if password_input:
-                        logging.info(f"成功使用选择器: {selector}")
-                        break
+                # 备选选择器合并为一个 XPath 查询，一次查找
+                password_input = self.browser.find_any(PASSWORD_ALT_XPATHS, timeout=5)
+                if password_input:
+                    logging.info("成功使用备选选择器找到密码输入框")
             
             if not password_input:
                 logging.error("所有选择器都无法找到密码输入框")
@@ -501,12 +674,10 @@ class TavilyAutoRegister:
 
             # 输入密码
             try:
-                # 清空输入框
-                password_input.clear()
-                time.sleep(0.5)
-                
-                # 输入密码
-                password_input.input(test_password)
+                # 清空并输入密码，一次调用完成
+                if not password_input.run_js(_SET_VALUE_JS % json.dumps(test_password)):
+                    # 表单没有接受脚本写入的值，改用逐字输入
+                    password_input.input(test_password, clear=True)
                 logging.info("密码输入完成")
                 time.sleep(2)  # 等待一会儿以便观察结果
                 return True
@@ -520,12 +691,12 @@ class TavilyAutoRegister:
             return False
         finally:
             time.sleep(3)  # 等待一会儿以便查看结果
-            self.browser.close()
+            self.close()
 
     def test_email_and_code(self):
         """测试邮箱和验证码输入功能"""
         try:
-            if not self.browser.start():
+            if not self._ensure_browser():
                 logging.error("浏览器启动失败")
                 return False
 
@@ -540,6 +711,7 @@ class TavilyAutoRegister:
             self.config.PASSWORD = test_password
 
             # 初始化 CaptchaHandler，传入config对象
+            from core.captcha_handler import CaptchaHandler
             self.captcha_handler = CaptchaHandler(self.browser.page, self.config)
 
             # 先导航到主页
@@ -549,65 +721,34 @@ class TavilyAutoRegister:
 
             # 等待页面加载
             logging.info("等待页面加载完成...")
-            time.sleep(5)  # 增加等待时间
+            self.browser.wait_for_navigation(timeout=self.config.PAGE_LOAD_TIMEOUT)
 
             # 查找并点击 Sign up 链接
             logging.info("正在查找 Sign up 链接...")
-            js_code = """
-            return document.querySelector('a[href*="/sign-up"]') ||
-                   document.querySelector('a[href*="/signup"]') ||
-                   Array.from(document.getElementsByTagName('a')).find(a => 
-                       a.textContent.trim() === 'Sign up'
-                   );
-            """
-            signup_link = self.browser.page.run_js(js_code)
-            
-            if signup_link:
-                logging.info("找到 Sign up 链接，正在点击...")
-                signup_link.click()
-                time.sleep(3)  # 等待页面跳转
+            prev_url = self.browser.page.url
+            if self.browser.page.run_js(_CLICK_SIGNUP_JS, self.config.PAGE_LOAD_TIMEOUT * 1000):
+                logging.info("已点击 Sign up 链接")
             else:
                 logging.error("未找到 Sign up 链接")
                 return False
             
-            # 等待注册页面加载
+            # 等待页面跳转并加载注册页面
             logging.info("等待注册页面加载完成...")
-            time.sleep(5)
+            self.browser.page.wait.url_change(prev_url, exclude=True, timeout=self.config.PAGE_LOAD_TIMEOUT)
+            self.browser.wait_for_navigation(timeout=self.config.PAGE_LOAD_TIMEOUT)
             
-            # 查找邮箱输入框
-            logging.info("正在查找邮箱输入框...")
-            js_code = """
-            return document.querySelector('#email') ||
-                   document.querySelector('input.c8429dee9.c2ca7b14a') ||
-                   document.querySelector('input[inputmode="email"][autocomplete="email"]') ||
-                   document.querySelector('input[type="text"][name="email"][required]');
-            """
-            email_input = self.browser.page.run_js(js_code)
-            
-            if email_input:
-                logging.info("找到邮箱输入框")
-                time.sleep(1)
-                
-                # 清空输入框
-                email_input.clear()
-                time.sleep(0.5)
-                
-                # 输入邮箱
-                email_input.input(test_email)
-                logging.info("邮箱输入完成")
-                time.sleep(1)
-
+            # 查找邮箱输入框并填入邮箱
+            if self._handle_email_input(test_email):
                 # 处理验证码
                 if not self.captcha_handler.verify_captcha(self.browser):
                     logging.error("验证码处理失败")
                     return False
                 
                 logging.info("验证码处理完成")
-                time.sleep(1)
 
                 return True
             
-            logging.error("未找到邮箱输入框")
+            # 未找到输入框时 _handle_email_input 已记录错误
             return False
 
         except Exception as e:
@@ -615,7 +756,7 @@ class TavilyAutoRegister:
             return False
         finally:
             time.sleep(3)  # 等待一会儿以便查看结果
-            self.browser.close()
+            self.close()
 
 def check_and_create_config():
     """
@@ -670,10 +811,22 @@ BROWSER_USER_AGENT=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/5
 BROWSER_WIDTH=1920
 # 浏览器窗口高度
 BROWSER_HEIGHT=1080
+# 页面加载超时时间（秒）
+PAGE_LOAD_TIMEOUT=10
+# 已运行浏览器的调试地址（如 http://localhost:9222），留空则每次启动新浏览器
+BROWSER_REMOTE_URL=
 
 # ====== 注册配置 ======
 # Tavily API 注册页面 URL
 REGISTER_URL=https://app.tavily.com/sign-up
+# 本次运行要注册的账号数量
+REGISTER_COUNT=1
+# 同时运行的浏览器数量（批量注册时强制使用无头模式）
+REGISTER_WORKERS=1
+
+# ====== 调试配置 ======
+# 是否启用调试模式（true/false），启用后会保存验证码截图到 screenshots 目录
+DEBUG=false
 """
     
     # 引导用户输入配置
@@ -732,15 +885,18 @@ def main():
         check_and_create_config()
         
         # 加载配置
-        config = Config()
+        config = get_config()
         logger.info("配置加载成功")
         
         # 显示当前配置
         config.print_config()
         
         # 创建注册实例并运行
-        register = TavilyAutoRegister()
-        register.start()  # 运行完整的注册流程
+        if config.REGISTER_COUNT > 1:
+            TavilyAutoRegister.start_batch(config.REGISTER_COUNT, config.REGISTER_WORKERS)  # 并行注册多个账号
+        else:
+            register = TavilyAutoRegister()
+            register.start()  # 运行完整的注册流程
         
     except Exception as e:
         logger.error(f"程序执行出错: {str(e)}")
@@ -12,10 +12,18 @@
 
 import os
 import sys
+import time
+import queue
+import atexit
 import logging
-from datetime import datetime
+import functools
+import logging.handlers
 
-def setup_logger():
+# 程序启动时间，用作日志文件名
+_START_TS = time.strftime("%Y%m%d_%H%M%S")
+
+@functools.lru_cache(maxsize=None)
+def setup_logger(level=logging.INFO):
     """
     设置日志记录器
     
@@ -25,50 +33,50 @@ def setup_logger():
     - 配置日志格式
     - 设置输出处理器
     
+    文件和控制台输出由后台线程中的 QueueListener 完成，
+    记录日志时只需将记录放入队列，不会阻塞在磁盘写入上。
+    结果按参数缓存，各模块重复调用时直接返回已配置的记录器，
+    不会重复创建日志文件和处理器
+    
+    Args:
+        level (int): 日志级别，默认为 INFO
+    
     Returns:
         Logger: 配置好的日志记录器实例
     """
+    # 根记录器已配置过处理器时直接复用
+    if logging.getLogger().handlers:
+        return logging.getLogger(__name__)
+
     # 创建 logs 目录（如果不存在）
     log_dir = "logs"
     if not os.path.exists(log_dir):
         os.makedirs(log_dir)
 
-    # 设置日志文件名（使用当前时间）
-    current_time = datetime.now().strftime("%Y%m%d_%H%M%S")
-    log_file = os.path.join(log_dir, f"tavily_auto_{current_time}.log")
+    # 设置日志文件名（使用程序启动时间）
+    log_file = os.path.join(log_dir, f"tavily_auto_{_START_TS}.log")
+
+    # 实际输出的处理器，由后台线程调用
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
+    handlers = [
+        logging.FileHandler(log_file, encoding='utf-8'),
+        logging.StreamHandler(sys.stdout)
+    ]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    # 根记录器只挂载队列处理器，入队时只保留消息本身，完整格式由输出处理器添加
+    log_queue = queue.Queue(-1)
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    logging.basicConfig(level=level, handlers=[queue_handler])
 
-    # 配置日志记录器
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S',
-        handlers=[
-            logging.FileHandler(log_file, encoding='utf-8'),
-            logging.StreamHandler(sys.stdout)
-        ]
-    )
+    # 启动后台输出线程，程序退出时处理完队列中剩余的记录
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
 
     return logging.getLogger(__name__)
 
 # 初始化日志记录器
 logger = setup_logger()
-
-# 设置日志格式
-log_format = '%(asctime)s - %(levelname)s - %(message)s'
-date_format = '%Y-%m-%d %H:%M:%S'
-
-# 配置日志记录器
-logging.basicConfig(
-    level=logging.INFO,  # 设置日志级别为 INFO
-    format=log_format,   # 使用预定义的日志格式
-    datefmt=date_format, # 使用预定义的日期格式
-    handlers=[
-        # 控制台输出处理器
-        logging.StreamHandler(sys.stdout),
-        # 文件输出处理器
-        logging.FileHandler(
-            filename=f'logs/tavily_auto_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log',
-            encoding='utf-8'
-        )
-    ]
-) 
@@ -12,11 +12,47 @@
 
 import random
 import string
+import secrets
+import threading
+import functools
 from utils.logger import setup_logger
-from config import Config
+from config import get_config
 
 logger = setup_logger()
 
+# 字符池在导入时计算一次，生成函数中直接复用
+_ALNUM = string.ascii_letters + string.digits
+_LOWER = string.ascii_lowercase
+_UPPER = string.ascii_uppercase
+_DIGITS = string.digits
+_SPECIAL = "@#$%"  # 只使用部分特殊字符
+_PW_ALL = _LOWER + _UPPER + _DIGITS + _SPECIAL
+
+# 每个线程独立的随机数生成器，并行注册时互不争用
+_rng = threading.local()
+
+# 密码按字节生成，预先编码各类字符池
+_PW_CLASSES = tuple(pool.encode('ascii') for pool in (_LOWER, _UPPER, _DIGITS, _SPECIAL))
+_PW_ALL_BYTES = _PW_ALL.encode('ascii')
+
+# 密码是真实账号的凭据，使用操作系统的安全随机源
+_SYSRAND = secrets.SystemRandom()
+
+def _get_rng():
+    """
+    获取当前线程的随机数生成器
+    
+    首次调用时以安全随机数作为种子创建，之后直接复用
+    
+    Returns:
+        random.Random: 当前线程专用的随机数生成器
+    """
+    rng = getattr(_rng, 'r', None)
+    if rng is None:
+        rng = random.Random(secrets.randbits(128))
+        _rng.r = rng
+    return rng
+
 def generate_random_string(length=8):
     """
     生成随机字符串
@@ -29,8 +65,20 @@ def generate_random_string(length=8):
     Returns:
         str: 生成的随机字符串
     """
-    characters = string.ascii_letters + string.digits
-    return ''.join(random.choice(characters) for _ in range(length))
+    return ''.join(_get_rng().choices(_ALNUM, k=length))
+
+@functools.lru_cache(maxsize=1)
+def _email_domain():
+    """
+    获取邮箱域名
+    
+    首次调用时从配置读取并去掉可能存在的@前缀，之后直接返回缓存值。
+    不在导入时读取，避免配置文件尚未创建时导入本模块就报错
+    
+    Returns:
+        str: 不含@的邮箱域名
+    """
+    return get_config().DOMAIN.strip('@')
 
 def generate_email():
     """
@@ -41,10 +89,7 @@ def generate_email():
     Returns:
         str: 生成的随机邮箱地址
     """
-    config = Config()
-    username = generate_random_string(8)
-    domain = config.DOMAIN.strip('@')  # 移除可能存在的@前缀
-    return f"{username}@{domain}"
+    return f"{generate_random_string(8)}@{_email_domain()}"
 
 def generate_password():
     """
@@ -62,27 +107,20 @@ def generate_password():
     """
     # 生成包含大小写字母、数字和特殊字符的密码
     length = 12
-    lowercase = string.ascii_lowercase
-    uppercase = string.ascii_uppercase
-    digits = string.digits
-    special = "@#$%"  # 只使用部分特殊字符
+    password = bytearray(length)
     
     # 确保密码包含所有类型的字符
-    password = [
-        random.choice(lowercase),
-        random.choice(uppercase),
-        random.choice(digits),
-        random.choice(special)
-    ]
+    for i, pool in enumerate(_PW_CLASSES):
+        password[i] = secrets.choice(pool)
     
     # 添加剩余的随机字符
-    remaining_length = length - len(password)
-    all_chars = lowercase + uppercase + digits + special
-    password.extend(random.choice(all_chars) for _ in range(remaining_length))
+    password[len(_PW_CLASSES):] = _SYSRAND.choices(_PW_ALL_BYTES, k=length - len(_PW_CLASSES))
     
-    # 打乱密码字符顺序
-    random.shuffle(password)
-    return ''.join(password)
+    # 原地打乱密码字符顺序（Fisher-Yates）
+    for i in range(length - 1, 0, -1):
+        j = secrets.randbelow(i + 1)
+        password[i], password[j] = password[j], password[i]
+    return password.decode('ascii')
 
 def generate_account_info(domain):
     """